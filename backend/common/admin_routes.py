@@ -0,0 +1,35 @@
+import asyncio
+import secrets
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi.responses import PlainTextResponse
+from common import config, profiling
+
+router = APIRouter()
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+async def profile_api(seconds: float = Query(config.PROFILE_DEFAULT_SECONDS, gt=0, le=config.PROFILE_MAX_SECONDS),
+                      interval: float = Query(config.PROFILE_SAMPLE_INTERVAL, gt=0, le=1),
+                      x_admin_token: Optional[str] = Header(None)) -> PlainTextResponse:
+    """
+    Samples the stacks of the API process for the given time.
+    Requires the 'X-Admin-Token' header matching the ADMIN_TOKEN environment variable.
+    Args:
+        seconds (float): how long to sample for.
+        interval (float): pause between two samples.
+
+    Returns:
+        PlainTextResponse: collapsed stacks file, can be rendered with flamegraph.pl or speedscope.
+    """
+    if not config.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Profiling is disabled.")
+    # compared as bytes, compare_digest rejects str with non-ASCII characters
+    if not x_admin_token or not secrets.compare_digest(x_admin_token.encode(), config.ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token.")
+    loop = asyncio.get_event_loop()
+    # sample from a worker thread, so the event loop keeps serving requests while being profiled
+    collapsed = await loop.run_in_executor(None, profiling.sample_stacks, seconds, interval)
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": 'attachment; filename="api-profile.collapsed"'},
+    )
@@ -0,0 +1,34 @@
+import os
+
+# OpenWeather publishes the 5 day forecast in 3 hour slots, cached forecasts expire on slot boundaries.
+FORECAST_WINDOW_SECONDS = 3 * 60 * 60
+
+# Consumer side forecast cache, least recently used cities are evicted first.
+FORECAST_CACHE_MAX_ENTRIES = 512
+
+# Popularity tracking of requested cities (Space-Saving sketch).
+POPULARITY_SKETCH_CAPACITY = 256
+
+# Background cache warmer.
+WARMER_TOP_N = 20
+WARMER_INTERVAL_SECONDS = 60
+WARMER_LEAD_SECONDS = 5 * 60
+WARMER_UPSTREAM_BUDGET = 5  # max upstream refreshes per warmer cycle
+WARMER_FAILURE_BACKOFF_SECONDS = 30 * 60  # a failed warm isn't retried before this
+
+# RPC clients give up waiting for a reply after this.
+RPC_TIMEOUT_SECONDS = 30
+
+# HTTP response caching in the API.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+GZIP_MINIMUM_SIZE = 1000  # bytes, smaller responses are sent uncompressed
+
+# On-demand profiling.
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")  # profiling endpoint is disabled when not set
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "/tmp/profiles")
+PROFILE_DEFAULT_SECONDS = 10
+PROFILE_MAX_SECONDS = 120
+PROFILE_SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+# cProfile capture of RPC requests slower than this, off when not set
+_slow_request_seconds = os.environ.get("PROFILE_SLOW_REQUEST_SECONDS")
+PROFILE_SLOW_REQUEST_SECONDS = float(_slow_request_seconds) if _slow_request_seconds else None
@@ -0,0 +1,26 @@
+from starlette.datastructures import MutableHeaders
+
+
+class WeakETagOnEncodingMiddleware:
+    """
+    Marks the ETag as weak when the body was content-encoded (e.g. by GZipMiddleware),
+    a strong validator must differ between the gzip and identity representations.
+    Has to be added after GZipMiddleware, so it wraps it and sees the final headers.
+    """
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/") and headers.get("content-encoding"):
+                    headers["etag"] = f"W/{etag}"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,136 @@
+import cProfile
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from common import config
+
+
+def sample_stacks(seconds: float, interval: float = config.PROFILE_SAMPLE_INTERVAL) -> str:
+    """
+    Periodically samples the stacks of all threads of the process, except the calling one.
+    Args:
+        seconds (float): how long to sample for.
+        interval (float): pause between two samples.
+    Returns:
+        str: collapsed stacks, one "thread;outer_frame;...;inner_frame count" line per stack,
+        ready for flamegraph.pl or speedscope.
+    """
+    own_thread = threading.get_ident()
+    stacks = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            frames.append(thread_names.get(thread_id, str(thread_id)))
+            stacks[";".join(reversed(frames))] += 1
+        time.sleep(interval)
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common()) + "\n"
+
+
+def write_profile(content: str, prefix: str, suffix: str = "collapsed") -> str:
+    """
+    Writes a profile into 'config.PROFILE_DIR'.
+    Returns:
+        str: path of the written file.
+    """
+    os.makedirs(config.PROFILE_DIR, exist_ok=True)
+    path = os.path.join(config.PROFILE_DIR, f"{prefix}-{os.getpid()}-{int(time.time())}.{suffix}")
+    with open(path, "w") as file:
+        file.write(content)
+    return path
+
+
+def install_signal_handler(signum: int = signal.SIGUSR1, seconds: float = config.PROFILE_DEFAULT_SECONDS) -> None:
+    """
+    Starts a sampling profile of the process whenever it receives 'signum', e.g. `kill -USR1 <pid>`.
+    The collapsed stacks are written into 'config.PROFILE_DIR'. Must be called from the main thread.
+    """
+    def run_profile():
+        path = write_profile(sample_stacks(seconds), "consumer")
+        # logging isn't configured in the consumer, so warning is the lowest level that reaches the operator
+        logging.warning(f"Sampling profile written to {path}.")
+
+    def handler(signum, frame):
+        logging.warning(f"Received signal {signum}, sampling stacks for {seconds}s.")
+        threading.Thread(target=run_profile, daemon=True, name="sampling-profiler").start()
+
+    signal.signal(signum, handler)
+
+
+def _start_profiler(name: str):
+    """
+    Returns:
+        cProfile.Profile: enabled profiler, or None if another profiler is already active.
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        logging.warning(f"Skipping cProfile capture of {name}, another profiler is active.")
+        return None
+    return profiler
+
+
+def _stop_profiler(profiler, name: str, started: float, threshold: float) -> None:
+    profiler.disable()
+    elapsed = time.perf_counter() - started
+    if elapsed > threshold:
+        os.makedirs(config.PROFILE_DIR, exist_ok=True)
+        path = os.path.join(config.PROFILE_DIR, f"{name}-{os.getpid()}-{int(time.time() * 1000)}.pstats")
+        profiler.dump_stats(path)
+        logging.warning(f"Slow request in {name} took {elapsed:.3f}s, cProfile stats written to {path}.")
+
+
+@contextmanager
+def profile_if_slow(name: str, threshold: float = config.PROFILE_SLOW_REQUEST_SECONDS):
+    """
+    Profiles the whole wrapped block with cProfile and keeps the stats only if it took longer than
+    'threshold' seconds, used around a complete RPC request.
+    Before Python 3.12 the profiler only sees the calling thread, work pushed into 'run_in_executor'
+    has to be wrapped with 'run_profiled' as well. Since Python 3.12 cProfile is built on 'sys.monitoring'
+    and covers the whole process, so the stats also contain executor threads and whatever other threads
+    did meanwhile. Only one capture can be active at a time there, overlapping requests run unprofiled
+    with a warning. Does nothing when the threshold is None.
+    """
+    profiler = _start_profiler(name) if threshold is not None else None
+    if profiler is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _stop_profiler(profiler, name, started, threshold)
+
+
+def run_profiled(name: str, func, *args, threshold: float = config.PROFILE_SLOW_REQUEST_SECONDS):
+    """
+    Calls func(*args) under cProfile and keeps the stats only if it took longer than 'threshold' seconds.
+    Meant for the synchronous part of a request where it actually runs, i.e. inside 'run_in_executor',
+    so it shows up before Python 3.12 too. Since Python 3.12 the request level 'profile_if_slow' capture
+    already covers executor threads, so func is just called.
+    Returns:
+        Result of func(*args).
+    """
+    if threshold is None or sys.version_info >= (3, 12):
+        return func(*args)
+    profiler = _start_profiler(name)
+    if profiler is None:
+        return func(*args)
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        _stop_profiler(profiler, name, started, threshold)
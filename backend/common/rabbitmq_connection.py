@@ -1,4 +1,5 @@
 import abc
+import threading
 import time
 import pika
 
@@ -30,6 +31,7 @@ class RabbitMQConnection(RPCConnectionInterface):
     This class is responsible for creating a connection which will be shared among services, implenting SingleTone pattern.
     """
     _inst = None
+    _lock = threading.Lock()  # connect() swaps the shared 'connection' attribute, RPC clients call it from worker threads
     
     def __new__(cls):
         if cls._inst is None:
@@ -42,19 +44,20 @@ class RabbitMQConnection(RPCConnectionInterface):
         self.connection = None
     
     def connect(self, server_name=SERVER_NAME):
-        self.server_name = server_name 
-        self.connection = None
-        while not self.connection:
-            try:
-                self.connection = pika.BlockingConnection(
-                    pika.ConnectionParameters(host=self.server_name)) 
-                # self.connection = pika.BlockingConnection(
-                #     pika.ConnectionParameters(host='localhost')) 
-                print("Connected to RabbbitMQ")
-            except pika.exceptions.AMQPConnectionError:
-                print("Waiting for RabbbitMq...")
-                time.sleep(5)
-        return self.connection
+        with self._lock:
+            self.server_name = server_name 
+            self.connection = None
+            while not self.connection:
+                try:
+                    self.connection = pika.BlockingConnection(
+                        pika.ConnectionParameters(host=self.server_name)) 
+                    # self.connection = pika.BlockingConnection(
+                    #     pika.ConnectionParameters(host='localhost')) 
+                    print("Connected to RabbbitMQ")
+                except pika.exceptions.AMQPConnectionError:
+                    print("Waiting for RabbbitMq...")
+                    time.sleep(5)
+            return self.connection
     
     def disconnect(self):
         if self.connection:
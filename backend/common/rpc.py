@@ -1,8 +1,9 @@
 import json
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+import time
 import uuid
-from common import rabbitmq_connection
+from common import config, profiling, rabbitmq_connection
 import pika
 from gif_service import giphy_req
 import asyncio
@@ -35,24 +36,31 @@ class BaseRPCServer:
         """
         # i dont' want in props a fethcer which is a function i need to be run right away, 
         # since it has to be awaited and the data which is awaited must be stored
-        request_data = json.loads(body) # parse incoming data
-        try:
-            data = await self.process_data(request_data)
-            response_body = json.dumps(data)
-            ch.basic_publish(
-                exchange='',
-                routing_key=props.reply_to,
-                body=response_body,
-                properties=pika.BasicProperties(
-                    correlation_id=props.correlation_id
+        # the whole round trip is measured, slow requests get a cProfile capture
+        with profiling.profile_if_slow(self.queue_name):
+            request_data = json.loads(body) # parse incoming data
+            try:
+                data = await self.process_data(request_data)
+                response_body = json.dumps(data)
+                print(f"Fetched data: {data}")
+            except Exception as e:
+                print(f"Error fetching data: {e}")
+                # the client blocks until it gets a reply, so errors are replied as well
+                response_body = json.dumps({"error": {"status_code": 500, "detail": str(e)}})
+            try:
+                ch.basic_publish(
+                    exchange='',
+                    routing_key=props.reply_to,
+                    body=response_body,
+                    properties=pika.BasicProperties(
+                        correlation_id=props.correlation_id
+                    )
                 )
-            )
-            print(f"Fetched data: {data}")
-        except Exception as e:
-            print(f"Error fetching data: {e}")
-        finally:
-            # Acknowledge the message
-            ch.basic_ack(delivery_tag=method.delivery_tag)
+            except Exception as e:
+                print(f"Error sending response: {e}")
+            finally:
+                # Acknowledge the message
+                ch.basic_ack(delivery_tag=method.delivery_tag)
             
     def consume_tasks(self):
         """
@@ -61,7 +69,7 @@ class BaseRPCServer:
         self.channel.basic_consume(
             queue=self.queue_name,
             on_message_callback=lambda ch, method, props, body:
-            asyncio.run(self.on_request(ch, method, props, body))
+            asyncio.run(self.__on_request(ch, method, props, body))
         )
         print('[*] Waiting for messages. To exit press CTRL+C')
         self.channel.start_consuming()
@@ -99,16 +107,19 @@ class BaseRPCClient:
         if self.corr_id == props.correlation_id:
             self.response = json.loads(body)
     
-    def __send_request(self, request_data, routing_key):
+    def send_request(self, request_data, routing_key, timeout: float = config.RPC_TIMEOUT_SECONDS):
         """
         Sends an RPC request and waits for the response.
         
         Args:
             request_data (dict): The request payload to be sent.
             routing_key (str): The RabbitMQ queue to send the request to.
+            timeout (float): How long to wait for the response in seconds.
 
         Returns:
             dict: The response from the RPC server.
+        Raises:
+            TimeoutError: If no response arrives within 'timeout'.
         """
         self.corr_id = str(uuid.uuid4())
         self.response = None
@@ -121,6 +132,10 @@ class BaseRPCClient:
             ),
             body=json.dumps(request_data)
         )
+        deadline = time.monotonic() + timeout
         while self.response is None:
-            self.connection.process_data_events()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No response from '{routing_key}' within {timeout}s.")
+            self.connection.process_data_events(time_limit=remaining)
         return self.response
\ No newline at end of file
@@ -1,5 +1,5 @@
 import threading
-from common import rabbitmq_connection 
+from common import rabbitmq_connection, profiling
 from weather_service import weather_rpc_server
 from gif_service.gif_rpc_server import GIFRPCServer
 import logging
@@ -15,6 +15,8 @@ def start_gif_consumer(connection):
 if __name__ == "__main__":
     connection = rabbitmq_connection.RabbitMQConnection()
     logging.info(f"Connection has been made successfully {connection}")
+    # `kill -USR1 <pid>` writes a sampling profile of the consumer threads into PROFILE_DIR
+    profiling.install_signal_handler()
 
     # Start both consumers in separate threads
     weather_thread = threading.Thread(target=start_weather_consumer, args=(connection,))
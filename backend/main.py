@@ -6,8 +6,12 @@ from contextlib import asynccontextmanager
 import logging
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from common import config
+from common.middleware import WeakETagOnEncodingMiddleware
 from weather_service.weather_routes import router as weather_router
 from gif_service.gif_routes import router as gif_router
+from common.admin_routes import router as admin_router
     
 
 import asyncio
@@ -32,10 +36,13 @@ import asyncio
 
 # app = FastAPI(lifespan=start_rpc_servers)
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=config.GZIP_MINIMUM_SIZE)
+app.add_middleware(WeakETagOnEncodingMiddleware)  # outermost, sees the headers GZip produced
     
 # Include weather router
 app.include_router(weather_router)
 app.include_router(gif_router)
+app.include_router(admin_router)
 
 
 
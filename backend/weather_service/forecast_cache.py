@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from common import config
+
+
+def next_forecast_window(now: float = None) -> float:
+    """
+    Calculates when the forecast changes next.
+    Args:
+        now (float): unix timestamp, current time by default.
+    Returns:
+        float: unix timestamp of the next forecast slot boundary.
+    """
+    now = time.time() if now is None else now
+    return (now // config.FORECAST_WINDOW_SECONDS + 1) * config.FORECAST_WINDOW_SECONDS
+
+
+class ForecastCache:
+    """
+    Keeps formatted forecasts until the forecast window they belong to is over, at most 'max_entries' of them (LRU).
+    Shared between the RPC consumer and the background warmer, so access is locked.
+    """
+    def __init__(self, max_entries: int = config.FORECAST_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (forecast, updated_at, expires_at)
+        self.failures = {}  # key -> timestamp until which fetching the key isn't retried
+        self.lock = threading.Lock()
+
+    def get_entry(self, key):
+        """
+        Returns:
+            tuple: (forecast, updated_at, expires_at) or None if the key is missing or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key, forecast, expires_at: float = None) -> tuple:
+        """
+        Stores a forecast, by default until the end of the current forecast window.
+        Returns:
+            tuple: the stored (forecast, updated_at, expires_at) entry.
+        """
+        expires_at = next_forecast_window() if expires_at is None else expires_at
+        entry = (forecast, time.time(), expires_at)
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.failures.pop(key, None)
+        return entry
+
+    def set_failure(self, key, retry_at: float) -> None:
+        """
+        Remembers a failed fetch (negative caching), so the key isn't refetched before 'retry_at'.
+        """
+        with self.lock:
+            self.failures[key] = retry_at
+
+    def is_failing(self, key) -> bool:
+        with self.lock:
+            return self.failures.get(key, 0) > time.time()
+
+    def purge_expired(self) -> None:
+        now = time.time()
+        with self.lock:
+            for key in [key for key, (_, _, expires_at) in self.entries.items() if expires_at <= now]:
+                del self.entries[key]
+            for key in [key for key, retry_at in self.failures.items() if retry_at <= now]:
+                del self.failures[key]
+
+    def expires_at(self, key) -> float:
+        """
+        Returns:
+            float: expiry timestamp of the entry, 0 if the key is not cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+        return entry[2] if entry else 0
+
+
+class CacheWarmer(threading.Thread):
+    """
+    Background thread which refreshes forecasts of the most requested cities just before their window changes,
+    so popular cities almost never hit a cold cache.
+    Popularity counts are halved at every forecast window, failed warms are backed off.
+
+    Args:
+        cache (ForecastCache): cache to refresh.
+        popularity (SpaceSavingCounter): request frequency of (service_name, city) keys.
+        fetcher (callable): fetcher(service_name, city) -> dict, the upstream request.
+    """
+    def __init__(self, cache, popularity, fetcher,
+                 top_n: int = config.WARMER_TOP_N,
+                 interval: float = config.WARMER_INTERVAL_SECONDS,
+                 lead_time: float = config.WARMER_LEAD_SECONDS,
+                 upstream_budget: int = config.WARMER_UPSTREAM_BUDGET,
+                 failure_backoff: float = config.WARMER_FAILURE_BACKOFF_SECONDS) -> None:
+        super().__init__(daemon=True, name="forecast-cache-warmer")
+        self.cache = cache
+        self.popularity = popularity
+        self.fetcher = fetcher
+        self.top_n = top_n
+        self.interval = interval
+        self.lead_time = lead_time
+        self.upstream_budget = upstream_budget
+        self.failure_backoff = failure_backoff
+        self.window = next_forecast_window()
+        self.stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            self.warm()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def warm(self) -> int:
+        """
+        Refreshes the hot keys which are missing or about to expire, at most 'upstream_budget' of them.
+        Returns:
+            int: number of upstream requests made.
+        """
+        self.cache.purge_expired()
+        if next_forecast_window() != self.window:
+            self.window = next_forecast_window()
+            self.popularity.decay()
+        refresh_before = time.time() + self.lead_time
+        requests_made = 0
+        for key, _ in self.popularity.top(self.top_n):
+            if requests_made >= self.upstream_budget:
+                break
+            if self.cache.expires_at(key) > refresh_before or self.cache.is_failing(key):
+                continue
+            service_name, city = key
+            requests_made += 1
+            try:
+                forecast = self.fetcher(service_name, city)
+                # the entry is refreshed ahead of time, so it has to outlive the upcoming boundary
+                self.cache.set(key, forecast, next_forecast_window(refresh_before))
+            except Exception as e:
+                self.cache.set_failure(key, time.time() + self.failure_backoff)
+                logging.error(f"Failed to warm forecast for {city}: {str(e)}")
+        if requests_made:
+            logging.info(f"Cache warmer refreshed {requests_made} forecasts.")
+        return requests_made
@@ -1 +1,2 @@
-from .models import WeatherRequestModel, WeatherResponseModel
\ No newline at end of file
+from .models import (WeatherRequestModel, WeatherResponseModel, ForecastEntryModel,
+                     ForecastProjectionModel, CompactWeatherResponseModel)
\ No newline at end of file
@@ -1,8 +1,34 @@
 from pydantic import BaseModel
+from typing import List, Optional
 
 class WeatherRequestModel(BaseModel):
     city: str
 
+class ForecastEntryModel(BaseModel):
+    dt: int
+    dt_txt: Optional[str] = None
+    temp: Optional[float] = None
+    feels_like: Optional[float] = None
+    temp_min: Optional[float] = None
+    temp_max: Optional[float] = None
+    humidity: Optional[int] = None
+    condition: Optional[str] = None
+
+class ForecastProjectionModel(BaseModel):
+    fields: Optional[List[str]] = None
+    hours: Optional[int] = None
+    days: Optional[int] = None
+
 class WeatherResponseModel(BaseModel):
+    service: str
+    city: str
+    forecast: List[str]
+    updated_at: Optional[float] = None
+    next_update: Optional[float] = None
+
+class CompactWeatherResponseModel(BaseModel):
+    service: str
     city: str
-    forecast: str
\ No newline at end of file
+    entries: List[ForecastEntryModel]
+    updated_at: Optional[float] = None
+    next_update: Optional[float] = None
@@ -0,0 +1,54 @@
+import threading
+from common import config
+
+
+class SpaceSavingCounter:
+    """
+    Tracks the most frequently requested keys in bounded memory using the Space-Saving algorithm.
+    At most 'capacity' keys are monitored, when a new key arrives and the table is full,
+    it replaces the least counted key and inherits its count (the inherited part is kept as the error).
+    """
+    def __init__(self, capacity: int = config.POPULARITY_SKETCH_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive number.")
+        self.capacity = capacity
+        self.counts = {}  # key -> (count, error)
+        self.lock = threading.Lock()
+
+    def increment(self, key) -> None:
+        """
+        Registers a single occurrence of a key.
+        Args:
+            key: hashable key, e.g. (service_name, city).
+        """
+        with self.lock:
+            if key in self.counts:
+                count, error = self.counts[key]
+                self.counts[key] = (count + 1, error)
+            elif len(self.counts) < self.capacity:
+                self.counts[key] = (1, 0)
+            else:
+                min_key = min(self.counts, key=lambda k: self.counts[k][0])
+                min_count, _ = self.counts.pop(min_key)
+                self.counts[key] = (min_count + 1, min_count)
+
+    def decay(self) -> None:
+        """
+        Halves all counts, so the ranking follows the current traffic instead of the all-time one.
+        Keys which drop to zero are forgotten.
+        """
+        with self.lock:
+            self.counts = {key: (count // 2, error // 2)
+                           for key, (count, error) in self.counts.items() if count // 2 > 0}
+
+    def top(self, n: int) -> list:
+        """
+        Returns the n most frequent keys.
+        Args:
+            n (int): number of keys to return.
+        Returns:
+            list: [(key, count), ...] sorted by count, highest first.
+        """
+        with self.lock:
+            ranked = sorted(self.counts.items(), key=lambda item: item[1][0], reverse=True)
+        return [(key, count) for key, (count, _) in ranked[:n]]
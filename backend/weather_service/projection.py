@@ -0,0 +1,52 @@
+import time
+from common import config
+from weather_service.models import (ForecastEntryModel, ForecastProjectionModel,
+                                    WeatherResponseModel, CompactWeatherResponseModel)
+
+ENTRY_FIELDS = set(ForecastEntryModel.model_fields)
+
+
+def project_forecast(weather_data: dict, projection: ForecastProjectionModel, now: float = None) -> dict:
+    """
+    Trims a forecast to what the client asked for, so the unused data is not serialized at all.
+    The horizon is counted from the start of the forecast window the data is cached for,
+    so the result stays the same for the whole window. Entries whose slot is over are dropped.
+    Args:
+        weather_data (dict): {"service", "city", "forecast", "entries", "updated_at", "next_update"}
+        projection (ForecastProjectionModel): requested fields and time horizon (hours/days).
+        now (float): fallback start of the horizon when the forecast has no 'next_update', current time by default.
+    Returns:
+        dict: 'CompactWeatherResponseModel' when fields are requested, 'WeatherResponseModel' otherwise.
+    Raises:
+        ValueError: If an unknown field is requested.
+    """
+    next_update = weather_data.get("next_update")
+    if next_update:
+        start = next_update - config.FORECAST_WINDOW_SECONDS
+    else:
+        start = time.time() if now is None else now
+
+    horizons = [start + projection.hours * 3600 if projection.hours else None,
+                start + projection.days * 86400 if projection.days else None]
+    horizons = [horizon for horizon in horizons if horizon is not None]
+    horizon = min(horizons) if horizons else float("inf")
+    keep = [i for i, entry in enumerate(weather_data["entries"])
+            if entry["dt"] + config.FORECAST_WINDOW_SECONDS > start and entry["dt"] < horizon]
+    sentences = [weather_data["forecast"][i] for i in keep]
+    entries = [weather_data["entries"][i] for i in keep]
+
+    common = {
+        "service": weather_data["service"],
+        "city": weather_data["city"],
+        "updated_at": weather_data.get("updated_at"),
+        "next_update": weather_data.get("next_update"),
+    }
+    if not projection.fields:
+        return WeatherResponseModel(forecast=sentences, **common).model_dump(exclude_none=True)
+
+    unknown = set(projection.fields) - ENTRY_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown forecast fields: {', '.join(sorted(unknown))}.")
+    fields = set(projection.fields) | {"dt"}
+    compact_entries = [ForecastEntryModel(**{field: entry[field] for field in fields}) for entry in entries]
+    return CompactWeatherResponseModel(entries=compact_entries, **common).model_dump(exclude_none=True)
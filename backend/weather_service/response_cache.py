@@ -0,0 +1,75 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from common import config
+
+
+class CachedResponse:
+    """
+    Serialized forecast response together with the HTTP caching metadata.
+    """
+    def __init__(self, forecast: dict) -> None:
+        self.body = json.dumps(forecast).encode("utf-8")
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+        self.last_modified = formatdate(forecast.get("updated_at", time.time()), usegmt=True)
+        self.expires_at = forecast.get("next_update", time.time())
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def matches(self, if_none_match: str) -> bool:
+        """
+        Checks whether the client's 'If-None-Match' header references this response.
+        """
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or self.etag in [tag.removeprefix("W/") for tag in tags]
+
+    def headers(self, if_none_match: str = None) -> dict:
+        """
+        Args:
+            if_none_match (str): for 304 responses, a weak tag the client validated with is echoed back,
+                since gzip-encoded responses carry the weak form (see 'WeakETagOnEncodingMiddleware').
+        """
+        max_age = max(0, int(self.expires_at - time.time()))
+        weak = bool(if_none_match) and f"W/{self.etag}" in if_none_match
+        return {
+            "ETag": f"W/{self.etag}" if weak else self.etag,
+            "Last-Modified": self.last_modified,
+            "Cache-Control": f"public, max-age={max_age}",
+        }
+
+
+class ResponseCache:
+    """
+    Local LRU cache of forecast responses in the API process.
+    Fresh entries are answered without publishing to the 'weather_rpc_queue'.
+    """
+    def __init__(self, max_entries: int = config.RESPONSE_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Returns:
+            CachedResponse: fresh cached response or None.
+        """
+        response = self.entries.get(key)
+        if response is None:
+            return None
+        if not response.is_fresh():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return response
+
+    def set(self, key, forecast: dict) -> CachedResponse:
+        response = CachedResponse(forecast)
+        self.entries[key] = response
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return response
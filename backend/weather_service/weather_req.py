@@ -1,6 +1,7 @@
 from common.api_key import WEATHER_API_KEY
 from geopy.geocoders import Nominatim
 import abc
+from typing import Iterator
 import requests
 import fastapi
 from pydantic import BaseModel
@@ -60,7 +61,9 @@ class ForecastFormatter(metaclass=abc.ABCMeta):
     @classmethod
     def __subclasshook__(cls, subclass: type) -> bool:
         return (hasattr(subclass, 'format_forecast') and
-                callable(getattr(subclass, 'format_forecast')))
+                callable(getattr(subclass, 'format_forecast')) and
+                hasattr(subclass, 'compact_forecast') and
+                callable(getattr(subclass, 'compact_forecast')))
     
     def format_forecast(self, forecast: dict) -> str:
         """
@@ -74,6 +77,18 @@ class ForecastFormatter(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement 'format_forecast' method.")
 
+    def compact_forecast(self, forecast: list) -> Iterator[dict]:
+        """
+        Extracts the structured values of each forecast entry, used for field projection.
+        Args:
+            forecast (list): forecast entries returned by the weather service (3 hour slots).
+        Returns:
+            generator: it holds (dict) entries with the fields of 'ForecastEntryModel'.
+        Rises:
+            NotImplementedError: If the method is not implemented in the subclass.
+        """
+        raise NotImplementedError("Subclasses must implement 'compact_forecast' method.")
+
 class OpenWeatherForecastFormatter:
     def format_forecast(self, forecasts):
         print(f"Total forecast entries: {len(forecasts)}")  # Should be 40 for 5 days
@@ -89,6 +104,19 @@ class OpenWeatherForecastFormatter:
                    f"It will feel like {feels_like}°C. The temperature range will be between {min_max_temp}, "
                    f"and the humidity will be {humidity}%.")
     
+    def compact_forecast(self, forecasts):
+        for forecast in forecasts:
+            yield {
+                "dt": forecast['dt'],  # Unix timestamp of the forecast
+                "dt_txt": forecast['dt_txt'],
+                "temp": forecast['main']['temp'],
+                "feels_like": forecast['main']['feels_like'],
+                "temp_min": forecast['main']['temp_min'],
+                "temp_max": forecast['main']['temp_max'],
+                "humidity": forecast['main']['humidity'],
+                "condition": forecast['weather'][0]['description'],
+            }
+
     def weather_details(self):
         pass
 
@@ -140,7 +168,12 @@ class UnifiedWeatherServiceHandler:
 
         Args:
             services (Dict[WeatherService, ForecastFormatter]): A dictionary that maps a weather service to its formatter.
+        Raises:
+            TypeError: If a formatter doesn't implement the 'ForecastFormatter' interface.
         """
+        for formatter in services.values():
+            if not isinstance(formatter, ForecastFormatter):
+                raise TypeError(f"'{formatter.__class__.__name__}' must implement 'format_forecast' and 'compact_forecast'.")
         self.services = services
     
     def fetch_forecast(self, service_name: str, city: str) -> dict:
@@ -153,7 +186,8 @@ class UnifiedWeatherServiceHandler:
 
         Returns:
         dict: Formatted weather forecast or an error message. 
-        {"service": service_name, "city": city, "forecast": formatted_data}
+        {"service": service_name, "city": city, "forecast": formatted_data, "entries": compact_data}
+        'entries' are aligned with 'forecast' by index.
         """
         # Find the correct weather service and formatter
         try:
@@ -163,7 +197,8 @@ class UnifiedWeatherServiceHandler:
                     if not forecast_data:
                         raise ValueError(f"No forecast data found for city: {city}")
                     formatted_data = list(formatter.format_forecast(forecast_data))
-                    return {"service": service_name, "city": city, "forecast": formatted_data}
+                    compact_data = list(formatter.compact_forecast(forecast_data))
+                    return {"service": service_name, "city": city, "forecast": formatted_data, "entries": compact_data}
             
             raise NameError(f"Weather service '{service_name}' not found.")
 
@@ -1,27 +1,74 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Header, Query, Response
 from weather_service import weather_rpc_client
+from weather_service.models import WeatherResponseModel, CompactWeatherResponseModel, ForecastProjectionModel
+from weather_service.projection import ENTRY_FIELDS
+from weather_service.response_cache import ResponseCache
 from common.rabbitmq_connection import RabbitMQConnection
 
 router = APIRouter()
+response_cache = ResponseCache()
 
-@router.get("/weather/get_forecast")
-async def get_weather_forecast(service_name: str, city: str = None) -> dict:
+def request_forecast(service_name: str, city: str, projection: dict) -> dict:
+    """
+    Blocking RPC round trip, run in a worker thread so the event loop keeps serving cached responses.
+    """
+    rpc_client = weather_rpc_client.WeatherRPCClient(RabbitMQConnection())
+    return rpc_client.request_weather(service_name, city, projection)
+
+@router.get(
+    "/weather/get_forecast",
+    responses={200: {"model": WeatherResponseModel | CompactWeatherResponseModel}},
+)
+async def get_weather_forecast(service_name: str, city: str = None,
+                               fields: Optional[str] = None,
+                               hours: Optional[int] = Query(None, gt=0),
+                               days: Optional[int] = Query(None, gt=0),
+                               if_none_match: Optional[str] = Header(None)) -> Response:
     """
     Unified endpoint to get weahter forecasts based on the service.
+    Responses carry ETag, Last-Modified and Cache-Control headers valid until the next forecast update,
+    a matching 'If-None-Match' is answered with 304 straight from the local response cache.
     Args:
         service_name (str): The name of the weather service to fetch the forecast from.
         city (str): The city for which to get the forecast (default is None).
-    
+        fields (str): Comma separated forecast entry fields, e.g. "temp,condition".
+            When given, compact entries are returned instead of the forecast sentences.
+        hours (int): Return only the forecast for the next N hours.
+        days (int): Return only the forecast for the next N days.
+        if_none_match (str): ETag of the forecast the client already has.
+
     Returns:
-        Dict: Weather forecast or error message.
+        Response: JSON weather forecast, 304 if the client's copy is up to date, or error message.
     """
     if not city:
         raise HTTPException(status_code=400, detail="City name must be provided.")
-    try:  
-        rpc_client = weather_rpc_client.WeatherRPCClient(RabbitMQConnection())      
-        forecast = rpc_client.request_weather(service_name, city)
-        return forecast
+    field_list = sorted({field.strip() for field in fields.split(",") if field.strip()}) if fields else None
+    unknown = set(field_list or []) - ENTRY_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown forecast fields: {', '.join(sorted(unknown))}.")
+    projection = ForecastProjectionModel(fields=field_list, hours=hours, days=days)
+
+    cache_key = (service_name, city.strip().lower(), tuple(field_list or ()), hours, days)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        if cached.matches(if_none_match):
+            return Response(status_code=304, headers=cached.headers(if_none_match))
+        return Response(content=cached.body, media_type="application/json", headers=cached.headers())
+    try:
+        loop = asyncio.get_event_loop()
+        forecast = await loop.run_in_executor(
+            None, request_forecast, service_name, city, projection.model_dump(exclude_none=True))
     except HTTPException as e:
         raise e
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Unexpected error {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Unexpected error {str(e)}")
+    if "error" in forecast:
+        raise HTTPException(status_code=forecast["error"]["status_code"], detail=forecast["error"]["detail"])
+    cached = response_cache.set(cache_key, forecast)
+    if cached.matches(if_none_match):
+        return Response(status_code=304, headers=cached.headers(if_none_match))
+    return Response(content=cached.body, media_type="application/json", headers=cached.headers())
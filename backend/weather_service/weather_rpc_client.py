@@ -4,17 +4,22 @@ class WeatherRPCClient(rpc.BaseRPCClient):
     def __init__(self, connection: rabbitmq_connection.RabbitMQConnection) -> None:
         super().__init__(connection)
     
-    def request_weather(self, city: str):
+    def request_weather(self, service_name: str, city: str, projection: dict = None):
         """
         Args:
             WeatherService_request: 
                 service_name (str): The name of the weather service to fetch the forecast from.
                 city (str): The city for which to get the forecast (default is None).
+                projection (dict): {"fields": [...], "hours": int, "days": int}, trimming done by the server.
         Returns:
             dict: Formatted weather forecast or an error message. 
-            {"service": service_name, "city": city, "forecast": formatted_data}
+            {"service": service_name, "city": city, "forecast": formatted_data, "updated_at": float, "next_update": float}
+            With 'fields' projection "entries" (compact forecast) are returned instead of "forecast".
+            Errors are returned as {"error": {"status_code": int, "detail": str}}.
+        Raises:
+            TimeoutError: If the server doesn't respond in time.
 
         """
-        request_data = {"city": city}
-        self.send_request(request_data, "weather_rpc_queue")    
+        request_data = {"service_name": service_name, "city": city, "projection": projection}
+        return self.send_request(request_data, "weather_rpc_queue")
 
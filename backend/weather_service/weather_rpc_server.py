@@ -1,15 +1,54 @@
-from common import rpc, rabbitmq_connection
-from weather_service import weather_req 
+from common import rpc, rabbitmq_connection, profiling
+from weather_service import weather_req
+from weather_service.models import ForecastProjectionModel
+from weather_service.projection import project_forecast
+from weather_service.forecast_cache import ForecastCache, CacheWarmer
+from weather_service.popularity import SpaceSavingCounter
 import asyncio
+import fastapi
 
 class WeatherServer(rpc.BaseRPCServer):
-    def __init__(self, connection: rabbitmq_connection.RabbitMQConnection) -> None:
+    def __init__(self, connection: rabbitmq_connection.RabbitMQConnection, warm_cache: bool = True) -> None:
         super().__init__(connection, "weather_rpc_queue")
-        
+        self.forecast_cache = ForecastCache()
+        self.popularity = SpaceSavingCounter()
+        self.cache_warmer = CacheWarmer(
+            self.forecast_cache,
+            self.popularity,
+            weather_req.weather_service_handler.fetch_forecast,
+        )
+        if warm_cache:
+            self.cache_warmer.start()
+
     async def process_data(self, request_data):
         service_name = request_data.get('service_name')
         city = request_data.get('city')
-        loop = asyncio.get_event_loop() # create an event loop
-        weather_data = await loop.run_in_executor(weather_req.weather_service_handler.fetch_forecast(service_name, city))  
-        # Fetch weather data for the city warpping sync function in in an async call with thread pool 
-        return weather_data
+        city = city.strip().lower() if city else city
+        # the warmer refetches by key, so cold fetches use the same normalized city and the cached body
+        # (and the HTTP ETag built from it) doesn't depend on which path filled the entry
+        key = (service_name, city)
+        entry = self.forecast_cache.get_entry(key)
+        if entry is None:
+            loop = asyncio.get_event_loop() # create an event loop
+            try:
+                weather_data = await loop.run_in_executor(
+                    None, profiling.run_profiled, f"{self.queue_name}-fetch",
+                    weather_req.weather_service_handler.fetch_forecast, service_name, city)
+            except fastapi.HTTPException as e:
+                # reply with the error, otherwise the client waits for a response which never comes
+                return {"error": {"status_code": e.status_code, "detail": e.detail}}
+            # Fetch weather data for the city warpping sync function in in an async call with thread pool,
+            # before Python 3.12 the request level capture doesn't see the executor thread,
+            # so slow fetches (geocode, upstream request, formatter) are profiled there separately
+            entry = self.forecast_cache.set(key, weather_data)
+        # counted only once the city is known to be valid, so bogus cities never become hot
+        self.popularity.increment(key)
+        weather_data, updated_at, next_update = entry
+        # timestamps let the HTTP layer build Last-Modified and Cache-Control headers
+        weather_data = {**weather_data, "updated_at": updated_at, "next_update": next_update}
+        # trim before serialization, so the broker only carries what the client asked for
+        projection = ForecastProjectionModel(**(request_data.get('projection') or {}))
+        try:
+            return project_forecast(weather_data, projection)
+        except ValueError as e:
+            return {"error": {"status_code": 400, "detail": str(e)}}